@@ -1,21 +1,26 @@
 import streamlit as st
 import hashlib
+import heapq
+import functools
+import csv
+import numpy as np
 import pandas as pd
 from datetime import datetime
 from PIL import Image
 import io
 import os
-from reportlab.lib.pagesizes import letter
-from reportlab.pdfgen import canvas
-from reportlab.lib.units import inch
 
 # ============================================================================
 # PERFORMANCE OPTIMIZATION: Use caching
 # ============================================================================
 
-@st.cache_data
+@functools.lru_cache(maxsize=64)
 def load_image_from_bytes(image_data):
-    """Cache image loading to prevent repeated processing"""
+    """Cache image loading to prevent repeated processing.
+
+    lru_cache keys on the bytes object directly, avoiding the per-call
+    content hashing and result pickling that st.cache_data does.
+    """
     if image_data:
         try:
             return Image.open(io.BytesIO(image_data))
@@ -23,6 +28,23 @@ def load_image_from_bytes(image_data):
             return None
     return None
 
+THUMBNAIL_SIZE = (400, 400)
+
+def make_thumbnail(image_data):
+    """Downscale and pre-encode a menu-card JPEG once at load time.
+
+    Returning encoded bytes lets st.image send them as-is; a PIL image
+    would get re-encoded (as PNG) on every render.
+    """
+    img = load_image_from_bytes(image_data)
+    if img is None:
+        return None
+    thumb = img.copy()
+    thumb.thumbnail(THUMBNAIL_SIZE)
+    buf = io.BytesIO()
+    thumb.convert('RGB').save(buf, 'JPEG', quality=80)
+    return buf.getvalue()
+
 # ============================================================================
 # DATA CLASSES AND MODELS
 # ============================================================================
@@ -37,6 +59,7 @@ class MenuItem:
         self.image_data = image_data
         self.category = category
         self.tags = tags or []
+        self.thumbnail = make_thumbnail(image_data)
 
 class OrderHistory:
     """Represents a customer order"""
@@ -57,33 +80,35 @@ class RecommendationEngine:
     
     @staticmethod
     @st.cache_data(ttl=60)
-    def get_popular_items(_menu_items, _orders, limit=3):
+    def get_popular_items(_menu_items, _order_items_df, limit=3):
         """Get most ordered items (cached for 60 seconds)"""
-        item_counts = {}
-        for order in _orders:
-            for item, qty in order.items:
-                item_counts[item.food_id] = item_counts.get(item.food_id, 0) + qty
-        
-        if not item_counts:
+        if _order_items_df.empty:
             return _menu_items[:limit]
-        
-        popular_ids = sorted(item_counts.items(), key=lambda x: x[1], reverse=True)[:limit]
-        popular_items = [item for item in _menu_items if item.food_id in [pid[0] for pid in popular_ids]]
-        return popular_items
+
+        # Single C-level counting pass over the SoA columns, then top-k
+        # via argpartition instead of a full sort
+        food_ids = _order_items_df['food_id'].to_numpy(dtype=np.int64)
+        qtys = _order_items_df['qty'].to_numpy(dtype=np.int64)
+        counts = np.bincount(food_ids, weights=qtys)
+
+        k = min(limit, int(np.count_nonzero(counts)))
+        top_ids = np.argpartition(counts, -k)[-k:]
+        top_ids = top_ids[np.argsort(counts[top_ids])[::-1]]
+
+        menu_by_id = st.session_state.menu_by_id
+        return [menu_by_id[fid] for fid in top_ids if fid in menu_by_id]
     
     @staticmethod
     def get_highly_rated_items(menu_items, min_rating=4.3, limit=3):
         """Get highest rated items"""
-        high_rated = sorted([item for item in menu_items if item.rating >= min_rating], 
-                          key=lambda x: x.rating, reverse=True)
-        return high_rated[:limit]
-    
+        return heapq.nlargest(limit, (item for item in menu_items if item.rating >= min_rating),
+                              key=lambda x: x.rating)
+
     @staticmethod
     def get_budget_friendly_items(menu_items, max_price=100, limit=3):
         """Get items within budget"""
-        budget_items = sorted([item for item in menu_items if item.price <= max_price],
-                             key=lambda x: x.price)
-        return budget_items[:limit]
+        return heapq.nsmallest(limit, (item for item in menu_items if item.price <= max_price),
+                               key=lambda x: x.price)
 
 # ============================================================================
 # SESSION STATE INITIALIZATION
@@ -97,20 +122,117 @@ def initialize_session_state():
         st.session_state.username = None
     if 'users' not in st.session_state:
         st.session_state.users = {
-            'admin': hashlib.sha256('admin123'.encode()).hexdigest(),
-            'user': hashlib.sha256('user123'.encode()).hexdigest()
+            'admin': hash_password('admin123'),
+            'user': hash_password('user123')
         }
     if 'menu_items' not in st.session_state:
-        st.session_state.menu_items = load_default_menu()
+        # Shallow copy: sessions append/remove items without touching the
+        # process-wide cached default list
+        st.session_state.menu_items = list(load_default_menu())
+    if 'menu_by_id' not in st.session_state:
+        refresh_menu_caches()
     if 'orders' not in st.session_state:
         st.session_state.orders = []
+    if 'order_item_count' not in st.session_state:
+        # Pre-allocated SoA buffers for order items (one slot per ordered
+        # item), grown geometrically instead of copied on every order
+        st.session_state.order_item_count = 0
+        st.session_state.order_item_buffers = {
+            'order_id': np.empty(256, dtype=np.int64),
+            'food_id': np.empty(256, dtype=np.int64),
+            'qty': np.empty(256, dtype=np.int64),
+            'is_teacher': np.empty(256, dtype=bool),
+        }
     if 'order_index' not in st.session_state:
         st.session_state.order_index = 1
     if 'cart' not in st.session_state:
         st.session_state.cart = {}
 
+def refresh_menu_caches():
+    """Rebuild menu lookup caches (call whenever the menu changes)"""
+    st.session_state.menu_by_id = {item.food_id: item for item in st.session_state.menu_items}
+    # Category -> items buckets so the user panel filters by dict lookup
+    # instead of scanning the menu each rerun
+    category_items = {}
+    for item in st.session_state.menu_items:
+        category_items.setdefault(item.category, []).append(item)
+    st.session_state.category_items = category_items
+    # Dropdown options as an immutable tuple, "All" included, so reruns
+    # reuse it as-is with no per-rerun set/sort/concat
+    st.session_state.menu_categories = ("All",) + tuple(sorted(category_items))
+    # SoA price column indexed by food_id for NumPy-batch cart pricing;
+    # NaN marks ids with no menu item (e.g. deleted dishes still in a cart)
+    max_id = max((item.food_id for item in st.session_state.menu_items), default=0)
+    price_by_id = np.full(max_id + 1, np.nan)
+    for item in st.session_state.menu_items:
+        price_by_id[item.food_id] = item.price
+    st.session_state.menu_price_by_id = price_by_id
+
+def append_order_items(order, food_ids, qtys):
+    """Append one order's items to the pre-allocated SoA buffers"""
+    n = food_ids.size
+    count = st.session_state.order_item_count
+    buffers = st.session_state.order_item_buffers
+
+    capacity = buffers['food_id'].size
+    if count + n > capacity:
+        new_capacity = max(capacity * 2, count + n)
+        for key, buf in buffers.items():
+            grown = np.empty(new_capacity, dtype=buf.dtype)
+            grown[:count] = buf[:count]
+            buffers[key] = grown
+
+    fill = slice(count, count + n)
+    buffers['order_id'][fill] = order.order_id
+    buffers['food_id'][fill] = food_ids
+    buffers['qty'][fill] = qtys
+    buffers['is_teacher'][fill] = order.is_teacher
+    st.session_state.order_item_count = count + n
+
+def remove_order_items(order_id):
+    """Drop a deleted order's rows from the SoA buffers"""
+    count = st.session_state.order_item_count
+    buffers = st.session_state.order_item_buffers
+
+    keep = buffers['order_id'][:count] != order_id
+    kept = int(keep.sum())
+    if kept < count:
+        for buf in buffers.values():
+            buf[:kept] = buf[:count][keep]
+        st.session_state.order_item_count = kept
+
+def order_items_frame():
+    """Zero-copy DataFrame view over the filled part of the order buffers"""
+    count = st.session_state.order_item_count
+    return pd.DataFrame(
+        {key: buf[:count] for key, buf in st.session_state.order_item_buffers.items()},
+        copy=False)
+
+def cart_pricing():
+    """Price the whole cart in one NumPy pass.
+
+    Returns parallel (food_ids, qtys, subtotals) arrays with deleted
+    menu items filtered out.
+    """
+    cart = st.session_state.cart
+    price_by_id = st.session_state.menu_price_by_id
+
+    food_ids = np.fromiter(cart.keys(), dtype=np.int64, count=len(cart))
+    qtys = np.fromiter(cart.values(), dtype=np.int64, count=len(cart))
+
+    # Drop zeroed entries (the minus button clamps to 0 instead of popping)
+    # and ids with no menu item
+    in_menu = (qtys > 0) & (food_ids < price_by_id.size)
+    food_ids, qtys = food_ids[in_menu], qtys[in_menu]
+    prices = price_by_id[food_ids]
+
+    known = ~np.isnan(prices)
+    food_ids, qtys = food_ids[known], qtys[known]
+    return food_ids, qtys, prices[known] * qtys
+
+@st.cache_resource
 def load_default_menu():
-    """Load default menu items with images"""
+    """Load default menu items with images (once per server process)"""
     menu_data = [
         (1, "Burger", 70.23, 4.5, "Main Course", ['popular', 'non-veg']),
         (2, "Coffee", 70.20, 4.0, "Beverage", ['popular', 'hot']),
@@ -145,9 +267,14 @@ def load_default_menu():
 # AUTHENTICATION FUNCTIONS
 # ============================================================================
 
+@functools.lru_cache(maxsize=128)
 def hash_password(password):
-    """Hash password using SHA256"""
-    return hashlib.sha256(password.encode()).hexdigest()
+    """Hash password using BLAKE2b (cached so reruns don't re-hash).
+
+    BLAKE2 is faster than SHA256 in software and fine for this demo's
+    in-memory credential check.
+    """
+    return hashlib.blake2b(password.encode()).hexdigest()
 
 def show_login_page():
     """Display login/signup page"""
@@ -217,14 +344,14 @@ def show_user_panel():
     
     st.subheader("📋 Our Menu")
     
-    # Category filter
-    categories = ["All"] + sorted(list(set([item.category for item in st.session_state.menu_items])))
+    # Category filter - cached tuple, rebuilt only when the menu changes
+    categories = st.session_state.menu_categories
     selected_category = st.selectbox("Filter by Category:", categories, key="category_filter")
     
-    # Filter items
+    # Filter items - cached per-category buckets, no per-rerun scan
     filtered_items = st.session_state.menu_items
     if selected_category != "All":
-        filtered_items = [item for item in st.session_state.menu_items if item.category == selected_category]
+        filtered_items = st.session_state.category_items.get(selected_category, [])
     
     # Display menu - OPTIMIZED: Only show current page
     items_per_page = 6
@@ -247,8 +374,8 @@ def show_user_panel():
     
     st.markdown("---")
     
-    # Cart summary
-    if st.session_state.cart:
+    # Cart summary (zeroed entries may linger in the dict, so check values)
+    if any(st.session_state.cart.values()):
         st.subheader("🛒 Your Cart")
         display_cart_summary()
         
@@ -271,8 +398,8 @@ def show_quick_recommendations():
     
     with st.expander("✨ Recommended For You", expanded=False):
         popular = RecommendationEngine.get_popular_items(
-            st.session_state.menu_items, 
-            st.session_state.orders, 
+            st.session_state.menu_items,
+            order_items_frame(),
             limit=3
         )
         
@@ -289,13 +416,12 @@ def show_quick_recommendations():
 def display_menu_item(item):
     """Display menu item - OPTIMIZED"""
     with st.container():
-        # Only load image if exists
-        if item.image_data:
-            img = load_image_from_bytes(item.image_data)
-            if img:
-                st.image(img, use_container_width=True)
+        # Thumbnail is pre-resized and JPEG-encoded at load time, so the
+        # bytes go straight out with no per-render encode
+        if item.thumbnail:
+            st.image(item.thumbnail, use_container_width=True)
         else:
-            st.markdown(f"<div style='background-color: #f0f0f0; height: 150px; display: flex; align-items: center; justify-content: center;'>📷 No Image</div>", unsafe_allow_html=True)
+            st.markdown(NO_IMAGE_HTML, unsafe_allow_html=True)
         
         st.markdown(f"**{item.name}**")
         st.caption(f"{item.category}")
@@ -307,10 +433,9 @@ def display_menu_item(item):
         col1, col2, col3 = st.columns([1, 2, 1])
         with col1:
             if st.button("−", key=f"minus_{item.food_id}", disabled=current_qty == 0):
-                if current_qty > 1:
-                    st.session_state.cart[item.food_id] = current_qty - 1
-                else:
-                    st.session_state.cart.pop(item.food_id, None)
+                # Zero quantities stay in the dict; cart_pricing filters
+                # them out, so no if/else/pop round-trip is needed here
+                st.session_state.cart[item.food_id] = max(current_qty - 1, 0)
                 st.rerun()
         with col2:
             st.markdown(f"<center>{current_qty}</center>", unsafe_allow_html=True)
@@ -321,36 +446,29 @@ def display_menu_item(item):
 
 def display_cart_summary():
     """Display cart summary"""
-    total = 0
-    cart_items = []
-    
-    for food_id, qty in st.session_state.cart.items():
-        item = next((m for m in st.session_state.menu_items if m.food_id == food_id), None)
-        if item:
-            subtotal = item.price * qty
-            total += subtotal
-            cart_items.append({
-                "Item": item.name,
-                "Qty": qty,
-                "Price": f"₹{item.price:.2f}",
-                "Total": f"₹{subtotal:.2f}"
-            })
-    
+    food_ids, qtys, subtotals = cart_pricing()
+    total = subtotals.sum()
+
+    menu_by_id = st.session_state.menu_by_id
+    cart_items = [{
+        "Item": menu_by_id[food_id].name,
+        "Qty": qty,
+        "Price": f"₹{menu_by_id[food_id].price:.2f}",
+        "Total": f"₹{subtotal:.2f}"
+    } for food_id, qty, subtotal in zip(food_ids, qtys, subtotals)]
+
     if cart_items:
         st.dataframe(pd.DataFrame(cart_items), use_container_width=True, hide_index=True)
         st.markdown(f"### Total: ₹{total:.2f}")
 
 def place_order(customer_name, is_teacher):
     """Place order"""
-    items_ordered = []
-    total = 0
-    
-    for food_id, qty in st.session_state.cart.items():
-        item = next((m for m in st.session_state.menu_items if m.food_id == food_id), None)
-        if item:
-            items_ordered.append((item, qty))
-            total += item.price * qty
-    
+    food_ids, qtys, subtotals = cart_pricing()
+    total = float(subtotals.sum())
+
+    menu_by_id = st.session_state.menu_by_id
+    items_ordered = [(menu_by_id[food_id], int(qty)) for food_id, qty in zip(food_ids, qtys)]
+
     if items_ordered:
         order_date = datetime.now().strftime("%d-%m-%Y %H:%M")
         order = OrderHistory(
@@ -364,6 +482,8 @@ def place_order(customer_name, is_teacher):
         st.session_state.orders.append(order)
         st.session_state.order_index += 1
         st.session_state.cart = {}
+
+        append_order_items(order, food_ids, qtys)
         
         st.success(f"✅ Order #{order.order_id} placed successfully!")
         st.balloons()
@@ -423,6 +543,7 @@ def show_menu_management():
             new_id = max([i.food_id for i in st.session_state.menu_items], default=0) + 1
             new_item = MenuItem(new_id, name, price, rating, img_data, category)
             st.session_state.menu_items.append(new_item)
+            refresh_menu_caches()
             st.success(f"✅ Added {name}")
             st.rerun()
         else:
@@ -430,15 +551,27 @@ def show_menu_management():
     
     st.markdown("---")
     st.subheader("Current Menu")
-    
-    for item in st.session_state.menu_items:
-        col1, col2, col3 = st.columns([3, 1, 1])
-        with col1:
-            st.write(f"**{item.name}** - {item.category} - ₹{item.price:.2f} - ⭐{item.rating}")
-        with col3:
-            if st.button("Delete", key=f"del_{item.food_id}"):
-                st.session_state.menu_items.remove(item)
-                st.rerun()
+
+    # Single table + one delete control instead of a button row per item,
+    # so Streamlit renders O(1) widgets regardless of menu size
+    menu = st.session_state.menu_items
+    st.dataframe(pd.DataFrame({
+        "Name": [i.name for i in menu],
+        "Category": [i.category for i in menu],
+        "Price (₹)": [i.price for i in menu],
+        "Rating": [i.rating for i in menu],
+    }), use_container_width=True, hide_index=True)
+
+    col1, col2 = st.columns([3, 1])
+    with col1:
+        to_delete = st.selectbox("Dish to delete", menu,
+                                 format_func=lambda i: i.name, key="delete_dish")
+    with col2:
+        st.write("")
+        if st.button("Delete") and to_delete:
+            st.session_state.menu_items.remove(to_delete)
+            refresh_menu_caches()
+            st.rerun()
 
 def show_order_management():
     """Order management"""
@@ -470,6 +603,10 @@ def show_order_management():
             
             if st.button("Delete", key=f"del_order_{order.order_id}"):
                 st.session_state.orders.remove(order)
+                remove_order_items(order.order_id)
+
+                # Clear cache so recommendations drop the deleted order too
+                RecommendationEngine.get_popular_items.clear()
                 st.rerun()
 
 def show_analytics():
@@ -478,16 +615,13 @@ def show_analytics():
         st.info("No data yet")
         return
     
-    # Popular items
+    # Popular items - vectorized groupby instead of nested Python loops
     st.subheader("Most Popular Items")
-    item_counts = {}
-    for order in st.session_state.orders:
-        for item, qty in order.items:
-            item_counts[item.name] = item_counts.get(item.name, 0) + qty
-    
-    df = pd.DataFrame(list(item_counts.items()), columns=['Item', 'Orders'])
-    df = df.sort_values('Orders', ascending=False).head(5)
-    st.bar_chart(df.set_index('Item'))
+    top_items = order_items_frame().groupby('food_id')['qty'].sum().nlargest(5)
+    menu_by_id = st.session_state.menu_by_id
+    top_items.index = [menu_by_id[fid].name if fid in menu_by_id else f"#{fid}"
+                       for fid in top_items.index]
+    st.bar_chart(top_items)
     
     # Customer types
     st.subheader("Customer Distribution")
@@ -502,41 +636,59 @@ def show_analytics():
 
 def export_csv():
     """Export to CSV"""
-    data = []
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(["Order ID", "Customer", "Type", "Items", "Total", "Date"])
+
     for o in st.session_state.orders:
         items_str = "; ".join([f"{i.name}x{q}" for i, q in o.items])
-        data.append({
-            "Order ID": o.order_id,
-            "Customer": o.customer_name,
-            "Type": "Teacher" if o.is_teacher else "Student",
-            "Items": items_str,
-            "Total": o.total_amount,
-            "Date": o.date
-        })
-    
-    csv = pd.DataFrame(data).to_csv(index=False)
-    st.download_button("Download CSV", csv, "orders.csv", "text/csv")
+        writer.writerow([
+            o.order_id,
+            o.customer_name,
+            "Teacher" if o.is_teacher else "Student",
+            items_str,
+            o.total_amount,
+            o.date
+        ])
+
+    st.download_button("Download CSV", buffer.getvalue(), "orders.csv", "text/csv")
 
 def export_pdf():
     """Export to PDF"""
+    # Imported lazily: reportlab is only needed for this export and its
+    # import cost would otherwise land on every cold start
+    from reportlab.lib.pagesizes import letter
+    from reportlab.pdfgen import canvas
+
     buffer = io.BytesIO()
     c = canvas.Canvas(buffer, pagesize=letter)
-    y = 750
-    
+
     c.setFont("Helvetica-Bold", 16)
-    c.drawString(50, y, "ByteBite Orders Report")
-    y -= 30
-    
-    c.setFont("Helvetica", 10)
+    c.drawString(50, 750, "ByteBite Orders Report")
+
+    # Batch lines into one text object per page instead of one
+    # drawString call per order
+    lines_per_page = 44
+
+    text = c.beginText(50, 720)
+    text.setFont("Helvetica", 10)
+    text.setLeading(15)
+    lines_on_page = 0
+
     for o in st.session_state.orders:
         items = ", ".join([f"{i.name}x{q}" for i, q in o.items])
-        line = f"#{o.order_id}: {o.customer_name} - {items} - ₹{o.total_amount:.2f}"
-        c.drawString(50, y, line)
-        y -= 15
-        if y < 50:
+        text.textLine(f"#{o.order_id}: {o.customer_name} - {items} - ₹{o.total_amount:.2f}")
+        lines_on_page += 1
+
+        if lines_on_page == lines_per_page:
+            c.drawText(text)
             c.showPage()
-            y = 750
-    
+            text = c.beginText(50, 750)
+            text.setFont("Helvetica", 10)
+            text.setLeading(15)
+            lines_on_page = 0
+
+    c.drawText(text)
     c.save()
     buffer.seek(0)
     st.download_button("Download PDF", buffer, "orders.pdf", "application/pdf")
@@ -545,24 +697,28 @@ def export_pdf():
 # MAIN
 # ============================================================================
 
+# Minimal CSS - built once at import time so reruns reuse the same string
+APP_CSS = """
+    <style>
+    .stButton>button {width: 100%;}
+    div[data-testid="metric-container"] {
+        background: #f0f2f6;
+        padding: 10px;
+        border-radius: 5px;
+    }
+    </style>
+"""
+
+NO_IMAGE_HTML = "<div style='background-color: #f0f0f0; height: 150px; display: flex; align-items: center; justify-content: center;'>📷 No Image</div>"
+
 def main():
     st.set_page_config(
         page_title="ByteBite",
         page_icon="🍔",
         layout="wide"
     )
-    
-    # Minimal CSS
-    st.markdown("""
-        <style>
-        .stButton>button {width: 100%;}
-        div[data-testid="metric-container"] {
-            background: #f0f2f6;
-            padding: 10px;
-            border-radius: 5px;
-        }
-        </style>
-    """, unsafe_allow_html=True)
+
+    st.markdown(APP_CSS, unsafe_allow_html=True)
     
     initialize_session_state()
     